@@ -1,5 +1,3 @@
-import hou
-
 VALUETYPES = [
     'Int',
     'Float',
@@ -30,21 +28,26 @@ def get_multiparm_dict(multi):
     Returns:
         list: list of dictionaries, each dict has _index key for parm index, index number is removed from parm name dict key
     """
-    offset = multi.parmTemplate().tags().get('multistartoffset', 1)
+    offset = int(multi.parmTemplate().tags().get('multistartoffset', 1))
     parameters = []
-    for index, params in enumerate(get_multiparm(multi)):
-        parameters.append({parm.name()[:-len(str(index+1))] : parm for parm in params})
-        _dict = parameters[-1]
-        _dict['_index'] = index+int(offset)
+    for index, params in enumerate(get_multiparm(multi), offset):
+        suffix = len(str(index))
+        _dict = {parm.name()[:-suffix] : parm for parm in params}
+        _dict['_index'] = index
+        parameters.append(_dict)
     return parameters
 
 
 def get_type(parm):
+    import hou
+
     if isinstance(parm, hou.Parm):
         return parm.parmTemplate().type().name()
     return None
 
 
 def get_menu_value(parm, label=False):
-    index = parm.eval()
-    return parm.menuLabels()[index] if label else parm.menuItems()[index]
+    if label:
+        return parm.menuLabels()[parm.eval()]
+    # evalAsString already resolves menu parms to their token
+    return parm.evalAsString()